@@ -2,84 +2,57 @@
 
 import pytest
 from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
-
-# Add src directory to path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from urllib.parse import quote
 
 from app import app, activities
 
 
-@pytest.fixture
+# Original participant lists, captured once at import before any test mutates them.
+# Signup only appends to participants, so that is the only state a test can change.
+_ORIGINAL_PARTICIPANTS = {
+    name: list(activity["participants"]) for name, activity in activities.items()
+}
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Provide a TestClient for the FastAPI application"""
-    return TestClient(app)
+    """Provide a TestClient for the FastAPI application, shared across the session"""
+    with TestClient(app) as c:
+        yield c
 
 
 @pytest.fixture
+def activities_json(client):
+    """Fetch GET /activities once and provide the parsed JSON body"""
+    response = client.get("/activities")
+    assert response.status_code == 200
+    return response.json()
+
+
+def _signup(client, activity, email):
+    """POST a signup for email to the named activity"""
+    return client.post(f"/activities/{quote(activity)}/signup", params={"email": email})
+
+
+@pytest.fixture
+def signup(client):
+    """Provide a signup(activity, email) helper bound to the shared client"""
+    return lambda activity, email: _signup(client, activity, email)
+
+
+def _restore_participants():
+    """Restore participant lists in place, skipping lists left untouched"""
+    for name, participants in _ORIGINAL_PARTICIPANTS.items():
+        current = activities[name]["participants"]
+        if current != participants:
+            current[:] = participants
+
+
+@pytest.fixture(autouse=True)
 def reset_activities():
-    """Reset activities to known state before each test"""
-    # Store original activities
-    original = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball team and practice sessions",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["alex@mergington.edu"]
-        },
-        "Tennis Club": {
-            "description": "Learn tennis techniques and participate in matches",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:00 PM",
-            "max_participants": 10,
-            "participants": ["jessica@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Explore painting, drawing, and sculpture techniques",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["maya@mergington.edu", "lucas@mergington.edu"]
-        },
-        "Music Ensemble": {
-            "description": "Join our orchestra and perform in school concerts",
-            "schedule": "Mondays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 25,
-            "participants": ["noah@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop public speaking and argumentation skills",
-            "schedule": "Tuesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 16,
-            "participants": ["ava@mergington.edu", "ethan@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Conduct experiments and explore scientific concepts",
-            "schedule": "Fridays, 3:30 PM - 4:30 PM",
-            "max_participants": 22,
-            "participants": ["grace@mergington.edu"]
-        }
-    }
-    
+    """Reset activities to known state before and after each test"""
+    # Restoring on setup also covers changes made outside a test's teardown,
+    # such as by another fixture or by code run at collection time
+    _restore_participants()
     yield
-    
-    # Reset activities to original state after test
-    activities.clear()
-    activities.update(original)
+    _restore_participants()